@@ -70,6 +70,18 @@ struct TrueColor final
     std::uint8_t b;
 };
 
+/*
+ * Text attribute flags of a stack frame.
+ *
+ * The bold to reverse video flags are in SGR code order.
+ */
+constexpr std::uint8_t attrBold = 1 << 0;
+constexpr std::uint8_t attrDim = 1 << 1;
+constexpr std::uint8_t attrItalic = 1 << 2;
+constexpr std::uint8_t attrUnderline = 1 << 3;
+constexpr std::uint8_t attrReverse = 1 << 4;
+constexpr std::uint8_t attrBright = 1 << 5;
+
 struct StackFrame final
 {
     void setFgColor(const std::uint8_t colorCodeOffset) noexcept
@@ -96,12 +108,7 @@ struct StackFrame final
         bgTrueColor = color;
     }
 
-    bool hasBold = false;
-    bool hasDim = false;
-    bool hasUnderline = false;
-    bool hasItalic = false;
-    bool hasReverse = false;
-    bool hasBright = false;
+    std::uint8_t attrs = 0;
     bool hasFgColor = false;
     std::uint8_t fgColorCodeOffset;
     bool hasBgColor = false;
@@ -195,27 +202,16 @@ private:
             return;
         }
 
+        /* SGR codes of the bold to reverse video flags */
+        static constexpr const char *attrCodes[] = {";1", ";2", ";3", ";4", ";7"};
+
         /* Reset first */
         _result += "\033[0";
 
-        if (frame.hasBold) {
-            _result += ";1";
-        }
-
-        if (frame.hasDim) {
-            _result += ";2";
-        }
-
-        if (frame.hasItalic) {
-            _result += ";3";
-        }
-
-        if (frame.hasUnderline) {
-            _result += ";4";
-        }
-
-        if (frame.hasReverse) {
-            _result += ";7";
+        for (auto i = 0U; i < sizeof attrCodes / sizeof *attrCodes; ++i) {
+            if (frame.attrs & (1 << i)) {
+                _result += attrCodes[i];
+            }
         }
 
         if (_hasTrueColorSupport && frame.hasFgTrueColor) {
@@ -229,7 +225,7 @@ private:
         } else if (frame.hasFgColor) {
             /* Basic foreground color */
             _result += ';';
-            this->_appendInt((frame.hasBright ? 90 : 30) + frame.fgColorCodeOffset);
+            this->_appendInt(((frame.attrs & attrBright) ? 90 : 30) + frame.fgColorCodeOffset);
         }
 
         if (_hasTrueColorSupport && frame.hasBgTrueColor) {
@@ -250,6 +246,26 @@ private:
         _result += 'm';
     }
 
+    /*
+     * Returns the position of the first `\` or `[` character from
+     * `_at`, or `_end` if there's none.
+     */
+    const char *_nextSpecialChar() const noexcept
+    {
+        /* Find the next `[`, then any `\` before it */
+        auto specialAt = static_cast<const char *>(std::memchr(_at, '[', _end - _at));
+
+        if (!specialAt) {
+            specialAt = _end;
+        }
+
+        if (const auto backslashAt = std::memchr(_at, '\\', specialAt - _at)) {
+            specialAt = static_cast<const char *>(backslashAt);
+        }
+
+        return specialAt;
+    }
+
     /*
      * Converts the hex digit character `*pos` to its numeric value.
      *
@@ -273,6 +289,30 @@ private:
         this->_throw(pos, ss.str());
     }
 
+    /*
+     * Returns the text attribute flag of the specifier `c`, or 0 if
+     * `c` isn't a text attribute specifier.
+     */
+    static std::uint8_t _attrFlag(const char c) noexcept
+    {
+        switch (c) {
+        case '!':
+            return attrBold;
+        case '-':
+            return attrDim;
+        case '_':
+            return attrUnderline;
+        case '\'':
+            return attrItalic;
+        case '^':
+            return attrReverse;
+        case '*':
+            return attrBright;
+        default:
+            return 0;
+        }
+    }
+
     /*
      * Tries to parse 6 hex digits as a true color.
      *
@@ -313,36 +353,30 @@ private:
             this->_throw("incomplete color specifier");
         }
 
+        /* ANSI color offsets of the letters `a` to `z` */
+        static constexpr std::uint8_t none = 0xff;
+        static constexpr std::uint8_t offsets[] = {
+            /* a     b     c     d     e     f     g     h     i */
+            none, 4,    6,    9,    none, none, 2,    none, none,
+
+            /* j     k     l     m     n     o     p     q     r */
+            none, 0,    none, 5,    none, none, none, none, 1,
+
+            /* s     t     u     v     w     x     y     z */
+            none, none, none, none, 7,    none, 3,    none,
+        };
+
         const auto c = *_at;
         ++_at;
 
-        switch (c) {
-        case 'k':
-            return 0;
-        case 'r':
-            return 1;
-        case 'g':
-            return 2;
-        case 'y':
-            return 3;
-        case 'b':
-            return 4;
-        case 'm':
-            return 5;
-        case 'c':
-            return 6;
-        case 'w':
-            return 7;
-        case 'd':
-            return 9;
-        default:
-            {
-                std::ostringstream ss;
-
-                ss << "unknown color specifier letter `" << c << "`";
-                this->_throw(ss.str());
-            }
+        if (c >= 'a' && c <= 'z' && offsets[c - 'a'] != none) {
+            return offsets[c - 'a'];
         }
+
+        std::ostringstream ss;
+
+        ss << "unknown color specifier letter `" << c << "`";
+        this->_throw(ss.str());
     }
 
     /*
@@ -395,32 +429,14 @@ private:
 
         /* Parse tag content flexibly */
         while (_at != _end && *_at != ']') {
+            const auto attrFlag = _attrFlag(*_at);
+
             if (*_at == ' ') {
                 /* Skip space */
                 ++_at;
-            } else if (*_at == '!') {
-                /* Bold */
-                frame.hasBold = true;
-                ++_at;
-            } else if (*_at == '-') {
-                /* Dim */
-                frame.hasDim = true;
-                ++_at;
-            } else if (*_at == '_') {
-                /* Underline */
-                frame.hasUnderline = true;
-                ++_at;
-            } else if (*_at == '\'') {
-                /* Italic */
-                frame.hasItalic = true;
-                ++_at;
-            } else if (*_at == '^') {
-                /* Reverse video */
-                frame.hasReverse = true;
-                ++_at;
-            } else if (*_at == '*') {
-                /* Bright foreground modifier */
-                frame.hasBright = true;
+            } else if (attrFlag) {
+                /* Text attribute or bright foreground modifier */
+                frame.attrs |= attrFlag;
                 ++_at;
             } else if (*_at == ':') {
                 /* Background color */
@@ -450,9 +466,8 @@ private:
         }
 
         /* Check for empty tag */
-        if (!frame.hasBold && !frame.hasDim && !frame.hasUnderline && !frame.hasItalic &&
-                !frame.hasReverse && !frame.hasBright && !frame.hasFgColor && !frame.hasBgColor &&
-                !frame.hasFgTrueColor && !frame.hasBgTrueColor) {
+        if (!frame.attrs && !frame.hasFgColor && !frame.hasBgColor && !frame.hasFgTrueColor &&
+                !frame.hasBgTrueColor) {
             this->_throw(startAt, "empty opening tag");
         }
 
@@ -526,29 +541,7 @@ private:
                     auto frame = _parseOpenTag();
 
                     /* Inherit attributes from current frame */
-                    if (!frame.hasBold && this->_stackBack().hasBold) {
-                        frame.hasBold = true;
-                    }
-
-                    if (!frame.hasDim && this->_stackBack().hasDim) {
-                        frame.hasDim = true;
-                    }
-
-                    if (!frame.hasUnderline && this->_stackBack().hasUnderline) {
-                        frame.hasUnderline = true;
-                    }
-
-                    if (!frame.hasItalic && this->_stackBack().hasItalic) {
-                        frame.hasItalic = true;
-                    }
-
-                    if (!frame.hasReverse && this->_stackBack().hasReverse) {
-                        frame.hasReverse = true;
-                    }
-
-                    if (!frame.hasBright && this->_stackBack().hasBright) {
-                        frame.hasBright = true;
-                    }
+                    frame.attrs |= this->_stackBack().attrs;
 
                     if (!frame.hasFgColor && this->_stackBack().hasFgColor) {
                         frame.setFgColor(this->_stackBack().fgColorCodeOffset);
@@ -570,9 +563,11 @@ private:
                     this->_appendSgrCode(frame);
                 }
             } else {
-                /* Append regular character */
-                _result += *_at;
-                ++_at;
+                /* Append regular characters up to the next special one */
+                const auto specialAt = this->_nextSpecialChar();
+
+                _result.append(_at, specialAt);
+                _at = specialAt;
             }
         }
 
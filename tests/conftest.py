@@ -0,0 +1,85 @@
+# Copyright (C) 2025 Philippe Proulx <eeppeliteloop@gmail.com>
+# SPDX-License-Identifier: MIT
+
+import ctypes
+import functools
+import importlib.util
+import os
+
+import pytest
+
+
+# Loads the `mint_py` module next to this file without adding the tests
+# directory to `sys.path`.
+def _load_mint_py():
+    spec = importlib.util.spec_from_file_location(
+        'mint_py', os.path.join(os.path.dirname(__file__), 'mint_py.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+mint_py = _load_mint_py()
+_testers_path = os.path.join(os.environ['MINT_BUILD_DIR'], 'tests', 'testers')
+
+
+# Calls mint::mint(), mint::escape(), and mint::escapeAnsi() in-process
+# through the `mint-capi` shared library.
+class _LibTester:
+    def __init__(self):
+        self._lib = ctypes.CDLL(os.path.join(_testers_path, 'libmint-capi.so'))
+
+        for fn in (self._lib.mint_parse, self._lib.mint_escape, self._lib.mint_escape_ansi):
+            fn.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t,
+                           ctypes.POINTER(ctypes.c_size_t)]
+            fn.restype = ctypes.c_int
+
+        # Output buffer for all the calls, grown on demand
+        self._buf = ctypes.create_string_buffer(64 * 1024)
+        self._len = ctypes.c_size_t()
+
+    # mint::mint(), mint::escape(), and mint::escapeAnsi() are pure, so
+    # a given mode and input always yield the same result.
+    @functools.lru_cache(maxsize=None)
+    def _call(self, fn_name: str, input_string: bytes):
+        fn = getattr(self._lib, fn_name)
+        status = fn(input_string, self._buf, len(self._buf), ctypes.byref(self._len))
+
+        if self._len.value > len(self._buf):
+            self._buf = ctypes.create_string_buffer(self._len.value)
+            status = fn(input_string, self._buf, len(self._buf), ctypes.byref(self._len))
+
+        return status, ctypes.string_at(self._buf, self._len.value)
+
+    def mint(self, input_string: bytes):
+        return self._call('mint_parse', input_string)
+
+    def escape(self, input_string: bytes):
+        return self._call('mint_escape', input_string)
+
+    def escape_ansi(self, input_string: bytes):
+        return self._call('mint_escape_ansi', input_string)
+
+
+# Calls the pure Python reference implementation of `mint_py`.
+class _PyTester:
+    def mint(self, input_string: bytes):
+        try:
+            return 0, mint_py.mint(input_string)
+        except mint_py.Error as exc:
+            # Error messages quote input bytes as is
+            return 1, str(exc).encode('latin-1')
+
+    def escape(self, input_string: bytes):
+        return 0, mint_py.escape(input_string)
+
+    def escape_ansi(self, input_string: bytes):
+        return 0, mint_py.escape_ansi(mint_py.mint(input_string))
+
+
+@pytest.fixture(scope='session', params=['c', 'py'])
+def mint_tester(request):
+    if request.param == 'c':
+        return _LibTester()
+
+    return _PyTester()
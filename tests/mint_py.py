@@ -0,0 +1,236 @@
+# Copyright (C) 2025 Philippe Proulx <eeppeliteloop@gmail.com>
+# SPDX-License-Identifier: MIT
+
+# Pure Python reference implementation of mint::mint() (always emitting
+# SGR codes, true colors included), mint::escape(), and
+# mint::escapeAnsi(), working on bytes.
+
+import dataclasses
+import re
+from typing import Optional
+
+
+class Error(Exception):
+    pass
+
+
+# Text attribute flags, in SGR code order, and the bright foreground
+# modifier
+_ATTR_FLAGS = {
+    ord('!'): 1 << 0,
+    ord('-'): 1 << 1,
+    ord("'"): 1 << 2,
+    ord('_'): 1 << 3,
+    ord('^'): 1 << 4,
+    ord('*'): 1 << 5,
+}
+
+_ATTR_CODES = (1, 2, 3, 4, 7)
+_BRIGHT = 1 << 5
+
+_COLOR_OFFSETS = {ord(letter): offset for letter, offset in zip('krgybmcwd', (0, 1, 2, 3, 4, 5, 6, 7, 9))}
+
+_HEX_DIGITS = b'0123456789abcdefABCDEF'
+
+_MAX_STACK_LEN = 5
+
+
+@dataclasses.dataclass
+class _Frame:
+    attrs: int = 0
+    fg_color: Optional[int] = None
+    bg_color: Optional[int] = None
+    fg_true_color: Optional[tuple] = None
+    bg_true_color: Optional[tuple] = None
+
+
+class _Parser:
+    def __init__(self, data: bytes):
+        self._data = data
+        self._at = 0
+        self._result = bytearray()
+        self._stack = []
+        self._parse()
+
+    @property
+    def result(self) -> bytes:
+        return bytes(self._result)
+
+    def _error(self, msg: str, pos: Optional[int] = None):
+        raise Error(f'At offset {self._at if pos is None else pos}: {msg}')
+
+    def _append_sgr_code(self, frame: _Frame):
+        codes = [0]
+        codes += [code for i, code in enumerate(_ATTR_CODES) if frame.attrs & (1 << i)]
+
+        if frame.fg_true_color is not None:
+            codes += [38, 2, *frame.fg_true_color]
+        elif frame.fg_color is not None:
+            codes.append((90 if frame.attrs & _BRIGHT else 30) + frame.fg_color)
+
+        if frame.bg_true_color is not None:
+            codes += [48, 2, *frame.bg_true_color]
+        elif frame.bg_color is not None:
+            codes.append(40 + frame.bg_color)
+
+        self._result += b'\x1b[' + b';'.join(b'%d' % code for code in codes) + b'm'
+
+    def _parse_hex_color(self) -> tuple:
+        if len(self._data) - self._at < 6:
+            self._error('incomplete true color specifier', self._at - 1)
+
+        for pos in range(self._at, self._at + 6):
+            if self._data[pos] not in _HEX_DIGITS:
+                self._error(f'invalid hex digit `{chr(self._data[pos])}` in true color specifier', pos)
+
+        digits = self._data[self._at:self._at + 6]
+        self._at += 6
+        return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4))
+
+    def _parse_basic_color(self) -> int:
+        if self._at == len(self._data):
+            self._error('incomplete color specifier')
+
+        c = self._data[self._at]
+        self._at += 1
+
+        if c not in _COLOR_OFFSETS:
+            self._error(f'unknown color specifier letter `{chr(c)}`')
+
+        return _COLOR_OFFSETS[c]
+
+    def _push(self, frame: _Frame):
+        if len(self._stack) >= _MAX_STACK_LEN:
+            self._error(f'maximum nesting depth ({_MAX_STACK_LEN - 1}) exceeded')
+
+        self._stack.append(frame)
+
+    def _parse_open_tag(self) -> _Frame:
+        data = self._data
+        frame = _Frame()
+        start_at = self._at
+        self._at += 1
+
+        while self._at != len(data) and data[self._at] != ord(']'):
+            c = data[self._at]
+
+            if c == ord(' '):
+                self._at += 1
+            elif c in _ATTR_FLAGS:
+                frame.attrs |= _ATTR_FLAGS[c]
+                self._at += 1
+            elif c == ord(':'):
+                self._at += 1
+
+                if self._at != len(data) and data[self._at] == ord('#'):
+                    self._at += 1
+                    frame.bg_true_color = self._parse_hex_color()
+                else:
+                    frame.bg_color = self._parse_basic_color()
+            elif c == ord('#'):
+                self._at += 1
+                frame.fg_true_color = self._parse_hex_color()
+            else:
+                frame.fg_color = self._parse_basic_color()
+
+        if self._at == len(data):
+            self._error('expecting `]` to terminate the opening tag')
+
+        if frame == _Frame():
+            self._error('empty opening tag', start_at)
+
+        self._at += 1
+        return frame
+
+    def _parse(self):
+        data = self._data
+        self._push(_Frame())
+
+        while self._at != len(data):
+            c = data[self._at]
+            start_at = self._at
+
+            if c == ord('\\'):
+                self._at += 1
+
+                if self._at == len(data):
+                    self._error('incomplete escape sequence at end of string', start_at)
+
+                if data[self._at] not in b'\\[':
+                    self._error(f'invalid escape sequence `\\{chr(data[self._at])}`', start_at)
+
+                self._result.append(data[self._at])
+                self._at += 1
+            elif c == ord('[') and data[self._at + 1:self._at + 2] == b'/':
+                slash_at = self._at + 1
+
+                while slash_at < len(data) and data[slash_at] == ord('/'):
+                    slash_at += 1
+
+                slash_count = slash_at - self._at - 1
+
+                if data[slash_at:slash_at + 1] != b']':
+                    self._error('unterminated closing tag', start_at)
+
+                if len(self._stack) <= slash_count:
+                    self._error(f'unbalanced closing tag: attempting to close {slash_count} level(s), '
+                                f'but only {len(self._stack) - 1} level(s) are open', start_at)
+
+                del self._stack[-slash_count:]
+                self._append_sgr_code(self._stack[-1])
+                self._at = slash_at + 1
+            elif c == ord('['):
+                frame = self._parse_open_tag()
+                parent = self._stack[-1]
+
+                # Inherit attributes from current frame
+                frame.attrs |= parent.attrs
+
+                if frame.fg_color is None:
+                    frame.fg_color = parent.fg_color
+
+                if frame.bg_color is None:
+                    frame.bg_color = parent.bg_color
+
+                if frame.fg_true_color is None:
+                    frame.fg_true_color = parent.fg_true_color
+
+                if frame.bg_true_color is None:
+                    frame.bg_true_color = parent.bg_true_color
+
+                self._push(frame)
+                self._append_sgr_code(frame)
+            else:
+                # Append regular characters up to the next special one
+                special_at = data.find(b'[', self._at)
+
+                if special_at < 0:
+                    special_at = len(data)
+
+                backslash_at = data.find(b'\\', self._at, special_at)
+
+                if backslash_at >= 0:
+                    special_at = backslash_at
+
+                self._result += data[self._at:special_at]
+                self._at = special_at
+
+        if len(self._stack) > 1:
+            self._error(f'unbalanced opening tag: {len(self._stack) - 1} level(s) remain unclosed')
+
+
+# Like mint::mint() with `mint::When::Always`.
+#
+# Raises `Error` on markup syntax error.
+def mint(data: bytes) -> bytes:
+    return _Parser(data).result
+
+
+# Like mint::escape().
+def escape(data: bytes) -> bytes:
+    return data.replace(b'\\', b'\\\\').replace(b'[', b'\\[')
+
+
+# Like mint::escapeAnsi().
+def escape_ansi(data: bytes) -> bytes:
+    return re.sub(rb'\x1b\[[^m]*m', b'', data)
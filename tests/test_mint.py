@@ -2,726 +2,475 @@
 # SPDX-License-Identifier: MIT
 
 import subprocess
+import functools
 import os
 import pty
 import select
 
+import pytest
+
 testers_path = os.path.join(os.environ['MINT_BUILD_DIR'], 'tests', 'testers')
 mint_tester_path = os.path.join(testers_path, 'mint-tester')
+escape_tester_path = os.path.join(testers_path, 'escape-tester')
+escape_ansi_tester_path = os.path.join(testers_path, 'escape-ansi-tester')
 terminal_support_tester_path = os.path.join(testers_path, 'terminal-support-tester')
+terminal_support_errno_tester_path = os.path.join(testers_path, 'terminal-support-errno-tester')
 
 
-def _test_success(input_string: str, expected_output: str):
-    result = subprocess.run([mint_tester_path, input_string], capture_output=True, text=True)
-    assert result.returncode == 0
-    assert result.stdout == expected_output
+# Runs a tester executable and captures its output as bytes.
+#
+# Not closing the inherited file descriptors makes `subprocess` spawn
+# the tester with posix_spawn() instead of fork() and exec().
+#
+# The tester doesn't inherit the standard input so that it never reads
+# from the terminal.
+def _run_tester(args: list, **kwargs):
+    return subprocess.run(args, stdin=subprocess.DEVNULL, close_fds=False,
+                          capture_output=True, **kwargs)
 
 
-def _test_failure(input_string: str, expected_error: str):
-    result = subprocess.run([mint_tester_path, input_string], capture_output=True, text=True)
-    assert result.returncode == 1
-    assert result.stdout == f'ERROR: {expected_error}'
+def _test_success(tester, input_string: bytes, expected_output: bytes):
+    status, output = tester.mint(input_string)
+    assert status == 0
+    assert output == expected_output
 
 
-def _test_escape(input_string: str, expected_output: str):
-    result = subprocess.run([os.path.join(testers_path, 'escape-tester'), input_string],
-                            capture_output=True, text=True)
-    assert result.returncode == 0
-    assert result.stdout == expected_output
+def _test_failure(tester, input_string: bytes, expected_error: bytes):
+    status, output = tester.mint(input_string)
+    assert status == 1
+    assert output == expected_error
 
 
-def _test_escape_ansi(input_string: str, expected_output: str):
-    result = subprocess.run([os.path.join(testers_path, 'escape-ansi-tester'), input_string],
-                            capture_output=True, text=True)
-    assert result.returncode == 0
-    assert result.stdout == expected_output
+def _test_escape(tester, input_string: bytes, expected_output: bytes):
+    status, output = tester.escape(input_string)
+    assert status == 0
+    assert output == expected_output
+
+
+def _test_escape_ansi(tester, input_string: bytes, expected_output: bytes):
+    status, output = tester.escape_ansi(input_string)
+    assert status == 0
+    assert output == expected_output
 
 
-def _test_terminal_support_with_pty(env: dict, expected_output: str):
+def _test_terminal_support_with_pty(env: dict, expected_output: bytes):
     master, slave = pty.openpty()
     process = subprocess.Popen([terminal_support_tester_path],
                                stdout=slave, stderr=slave, env=env)
     os.close(slave)
-    output = os.read(master, 16).decode().strip()
+    output = os.read(master, 16).strip()
     os.close(master)
     process.wait()
     assert output == expected_output
 
 
-def _test_terminal_support_no_tty(env: dict, expected_output: str):
-    result = subprocess.run([terminal_support_tester_path],
-                            capture_output=True, text=True, env=env)
+def _test_terminal_support_no_tty(env: dict, expected_output: bytes):
+    result = _run_tester([terminal_support_tester_path], env=env)
     assert result.returncode == 0
     assert result.stdout.strip() == expected_output
 
 
-def test_bold():
-    _test_success('[!]bold text[/]', '\033[0;1mbold text\033[0m')
-
-
-def test_underline():
-    _test_success('[_]underlined text[/]', '\033[0;4munderlined text\033[0m')
-
-
-def test_italic():
-    _test_success("[']italic text[/]", '\033[0;3mitalic text\033[0m')
-
-
-def test_dim():
-    _test_success('[-]dim text[/]', '\033[0;2mdim text\033[0m')
-
-
-def test_reverse():
-    _test_success('[^]reverse video[/]', '\033[0;7mreverse video\033[0m')
-
-
-def test_bright_red():
-    _test_success('[*r]bright red[/]', '\033[0;91mbright red\033[0m')
-
-
-def test_bright_alone():
-    _test_success('[*]bright alone[/]', '\033[0mbright alone\033[0m')
-
-
-def test_bright_default_color():
-    _test_success('[*d]bright default[/]', '\033[0;99mbright default\033[0m')
-
-
-def test_fg_color_default():
-    _test_success('[d]default color[/]', '\033[0;39mdefault color\033[0m')
-
-
-def test_fg_color_black():
-    _test_success('[k]black text[/]', '\033[0;30mblack text\033[0m')
-
-
-def test_fg_color_red():
-    _test_success('[r]red text[/]', '\033[0;31mred text\033[0m')
-
-
-def test_fg_color_green():
-    _test_success('[g]green text[/]', '\033[0;32mgreen text\033[0m')
-
-
-def test_fg_color_yellow():
-    _test_success('[y]yellow text[/]', '\033[0;33myellow text\033[0m')
-
-
-def test_fg_color_blue():
-    _test_success('[b]blue text[/]', '\033[0;34mblue text\033[0m')
-
-
-def test_fg_color_magenta():
-    _test_success('[m]magenta text[/]', '\033[0;35mmagenta text\033[0m')
-
-
-def test_fg_color_cyan():
-    _test_success('[c]cyan text[/]', '\033[0;36mcyan text\033[0m')
-
-
-def test_fg_color_white():
-    _test_success('[w]white text[/]', '\033[0;37mwhite text\033[0m')
-
-
-def test_bg_color_default():
-    _test_success('[:d]default bg[/]', '\033[0;49mdefault bg\033[0m')
-
-
-def test_bg_color_black():
-    _test_success('[:k]black bg[/]', '\033[0;40mblack bg\033[0m')
-
-
-def test_bg_color_red():
-    _test_success('[:r]red bg[/]', '\033[0;41mred bg\033[0m')
-
-
-def test_bg_color_green():
-    _test_success('[:g]green bg[/]', '\033[0;42mgreen bg\033[0m')
-
-
-def test_bg_color_yellow():
-    _test_success('[:y]yellow bg[/]', '\033[0;43myellow bg\033[0m')
-
-
-def test_bg_color_blue():
-    _test_success('[:b]blue bg[/]', '\033[0;44mblue bg\033[0m')
-
-
-def test_bg_color_magenta():
-    _test_success('[:m]magenta bg[/]', '\033[0;45mmagenta bg\033[0m')
-
-
-def test_bg_color_cyan():
-    _test_success('[:c]cyan bg[/]', '\033[0;46mcyan bg\033[0m')
-
-
-def test_bg_color_white():
-    _test_success('[:w]white bg[/]', '\033[0;47mwhite bg\033[0m')
-
-
-def test_bold_underline():
-    _test_success('[!_]bold and underlined[/]', '\033[0;1;4mbold and underlined\033[0m')
-
-
-def test_bold_dim():
-    _test_success('[!-]bold and dim[/]', '\033[0;1;2mbold and dim\033[0m')
-
-
-def test_bold_italic():
-    _test_success("[!']bold and italic[/]", '\033[0;1;3mbold and italic\033[0m')
-
-
-def test_dim_underline():
-    _test_success('[-_]dim and underline[/]', '\033[0;2;4mdim and underline\033[0m')
-
-
-def test_dim_italic():
-    _test_success("[-']dim and italic[/]", '\033[0;2;3mdim and italic\033[0m')
-
-
-def test_underline_italic():
-    _test_success("[_']underline and italic[/]", '\033[0;3;4munderline and italic\033[0m')
-
-
-def test_bold_reverse():
-    _test_success('[!^]bold and reverse[/]', '\033[0;1;7mbold and reverse\033[0m')
-
-
-def test_all_text_attributes():
-    _test_success("[!-_'^]all text attrs[/]", '\033[0;1;2;3;4;7mall text attrs\033[0m')
-
-
-def test_attribute_order_bold_red():
-    _test_success('[r!]red bold[/]', '\033[0;1;31mred bold\033[0m')
-
-
-def test_attribute_order_mixed():
-    _test_success("['_!]mixed order[/]", '\033[0;1;3;4mmixed order\033[0m')
-
-
-def test_attribute_order_color_first():
-    _test_success("[y!_':b]color first[/]", '\033[0;1;3;4;33;44mcolor first\033[0m')
-
-
-def test_bold_red():
-    _test_success('[!r]bold red[/]', '\033[0;1;31mbold red\033[0m')
-
-
-def test_underline_blue():
-    _test_success('[_b]underline blue[/]', '\033[0;4;34munderline blue\033[0m')
-
-
-def test_italic_green():
-    _test_success("['g]italic green[/]", '\033[0;3;32mitalic green\033[0m')
-
-
-def test_dim_red():
-    _test_success('[-r]dim red[/]', '\033[0;2;31mdim red\033[0m')
-
-
-def test_reverse_red():
-    _test_success('[^r]reverse red[/]', '\033[0;7;31mreverse red\033[0m')
-
-
-def test_fg_and_bg_colors():
-    _test_success('[y:b]yellow on blue[/]', '\033[0;33;44myellow on blue\033[0m')
-
-
-def test_bold_italic_underline_red_on_white():
-    _test_success("[!'_r:w]complex[/]", '\033[0;1;3;4;31;47mcomplex\033[0m')
-
-
-def test_bright_bold_cyan():
-    _test_success('[*!c]bright bold cyan[/]', '\033[0;1;96mbright bold cyan\033[0m')
-
-
-def test_bright_yellow():
-    _test_success('[*y]bright yellow[/]', '\033[0;93mbright yellow\033[0m')
-
-
-def test_bright_green():
-    _test_success('[*g]bright green[/]', '\033[0;92mbright green\033[0m')
-
-
-def test_bright_magenta():
-    _test_success('[*m]bright magenta[/]', '\033[0;95mbright magenta\033[0m')
-
-
-def test_bright_black():
-    _test_success('[*k]bright black[/]', '\033[0;90mbright black\033[0m')
-
-
-def test_bright_blue():
-    _test_success('[*b]bright blue[/]', '\033[0;94mbright blue\033[0m')
-
-
-def test_bright_white():
-    _test_success('[*w]bright white[/]', '\033[0;97mbright white\033[0m')
-
-
-def test_bright_with_bg_only():
-    _test_success('[*:r]bright bg[/]', '\033[0;41mbright bg\033[0m')
-
-
-def test_true_color_fg():
-    _test_success('[#ff0000]red[/]', '\033[0;38;2;255;0;0mred\033[0m')
-
-
-def test_true_color_fg_lowercase():
-    _test_success('[#00ff00]green[/]', '\033[0;38;2;0;255;0mgreen\033[0m')
-
-
-def test_true_color_fg_uppercase():
-    _test_success('[#0000FF]blue[/]', '\033[0;38;2;0;0;255mblue\033[0m')
-
-
-def test_true_color_bg():
-    _test_success('[:#ffff00]yellow bg[/]', '\033[0;48;2;255;255;0myellow bg\033[0m')
-
-
-def test_true_color_fg_and_bg():
-    _test_success('[#ffffff:#000000]white on black[/]',
-                  '\033[0;38;2;255;255;255;48;2;0;0;0mwhite on black\033[0m')
-
-
-def test_true_color_with_bold():
-    _test_success('[!#e74c3c]bold red[/]', '\033[0;1;38;2;231;76;60mbold red\033[0m')
-
-
-def test_true_color_with_italic_underline():
-    _test_success("['_#3498db]styled blue[/]", '\033[0;3;4;38;2;52;152;219mstyled blue\033[0m')
-
-
-def test_plain_text():
-    _test_success('no tags here', 'no tags here')
-
-
-def test_empty_string():
-    _test_success('', '')
-
-
-def test_empty_tagged_content():
-    _test_success('[r][/]', '\033[0;31m\033[0m')
-
-
-def test_tags_with_surrounding_text():
-    _test_success('before [r]red[/] after', 'before \033[0;31mred\033[0m after')
-
-
-def test_multiple_separate_tags():
-    _test_success('[r]red[/] and [b]blue[/]', '\033[0;31mred\033[0m and \033[0;34mblue\033[0m')
-
-
-def test_escape_backslash():
-    _test_success('\\\\', '\\')
-
-
-def test_escape_bracket():
-    _test_success('\\[', '[')
-
-
-def test_escape_in_text():
-    _test_success('Use \\[r] for red', 'Use [r] for red')
-
-
-def test_nested_bold_in_red():
-    _test_success('[r]red [!]and bold[/][/]',
-                  '\033[0;31mred \033[0;1;31mand bold\033[0;31m\033[0m')
-
-
-def test_nested_red_in_bold():
-    _test_success('[!]bold [r]and red[/][/]',
-                  '\033[0;1mbold \033[0;1;31mand red\033[0;1m\033[0m')
-
-
-def test_nested_underline_in_italic():
-    _test_success("[']italic [_]and underline[/][/]",
-                  '\033[0;3mitalic \033[0;3;4mand underline\033[0;3m\033[0m')
-
-
-def test_nested_dim_in_bold():
-    _test_success('[!]bold [-]and dim[/][/]',
-                  '\033[0;1mbold \033[0;1;2mand dim\033[0;1m\033[0m')
-
-
-def test_nested_reverse_in_bold():
-    _test_success('[!]bold [^]and reverse[/][/]',
-                  '\033[0;1mbold \033[0;1;7mand reverse\033[0;1m\033[0m')
-
-
-def test_nested_bold_in_dim():
-    _test_success('[-]dim [!]and bold[/][/]',
-                  '\033[0;2mdim \033[0;1;2mand bold\033[0;2m\033[0m')
-
-
-def test_nested_bg_in_fg():
-    _test_success('[r]red [:b]on blue[/][/]',
-                  '\033[0;31mred \033[0;31;44mon blue\033[0;31m\033[0m')
-
-
-def test_nested_fg_in_bg():
-    _test_success('[:b]blue bg [y]yellow text[/][/]',
-                  '\033[0;44mblue bg \033[0;33;44myellow text\033[0;44m\033[0m')
-
-
-def test_nested_three_levels():
-    _test_success('[r]red [!]bold [_]underline[/][/][/]',
-                  '\033[0;31mred \033[0;1;31mbold \033[0;1;4;31munderline\033[0;1;31m\033[0;31m\033[0m')
-
-
-def test_nested_bright_in_color():
-    _test_success('[r]red [*]bright[/][/]',
-                  '\033[0;31mred \033[0;91mbright\033[0;31m\033[0m')
-
-
-def test_nested_color_in_bright():
-    _test_success('[*r]bright red [g]green[/][/]',
-                  '\033[0;91mbright red \033[0;92mgreen\033[0;91m\033[0m')
-
-
-def test_nested_all_attributes():
-    _test_success("[!]b [_]u [']i [r]r[/][/][/][/]",
-                  '\033[0;1mb \033[0;1;4mu \033[0;1;3;4mi \033[0;1;3;4;31mr\033[0;1;3;4m\033[0;1;4m\033[0;1m\033[0m')
-
-
-def test_nested_with_text_between():
-    _test_success('[r]start [!]middle[/] end[/]',
-                  '\033[0;31mstart \033[0;1;31mmiddle\033[0;31m end\033[0m')
-
-
-def test_nested_same_attribute():
-    _test_success('[!]bold [!]still bold[/][/]',
-                  '\033[0;1mbold \033[0;1mstill bold\033[0;1m\033[0m')
-
-
-def test_nested_multiple_colors():
-    _test_success('[r]red [g]green [b]blue[/][/][/]',
-                  '\033[0;31mred \033[0;32mgreen \033[0;34mblue\033[0;32m\033[0;31m\033[0m')
-
-
-def test_nested_multiple_backgrounds():
-    _test_success('[:r]red bg [:b]blue bg[/][/]',
-                  '\033[0;41mred bg \033[0;44mblue bg\033[0;41m\033[0m')
-
-
-def test_consecutive_nested_tags():
-    _test_success("[!][_][']text[/][/][/]",
-                  '\033[0;1m\033[0;1;4m\033[0;1;3;4mtext\033[0;1;4m\033[0;1m\033[0m')
-
-
-def test_multi_slash_double_close():
-    _test_success('[r]red [!]bold[//]',
-                  '\033[0;31mred \033[0;1;31mbold\033[0m')
-
-
-def test_multi_slash_triple_close():
-    _test_success('[r]red [!]bold [_]underline[///]',
-                  '\033[0;31mred \033[0;1;31mbold \033[0;1;4;31munderline\033[0m')
-
-
-def test_multi_slash_quadruple_close():
-    _test_success("[r]red [!]bold [_]underline [']italic[////]",
-                  '\033[0;31mred \033[0;1;31mbold \033[0;1;4;31munderline \033[0;1;3;4;31mitalic\033[0m')
-
-
-def test_multi_slash_with_text_after():
-    _test_success('[r]red [!]bold[//] normal text',
-                  '\033[0;31mred \033[0;1;31mbold\033[0m normal text')
-
-
-def test_multi_slash_mixed_with_single():
-    _test_success('[r]red [!]bold [_]underline[/] back to bold[//]',
-                  '\033[0;31mred \033[0;1;31mbold \033[0;1;4;31munderline\033[0;1;31m back to bold\033[0m')
-
-
-def test_multi_slash_double_in_middle():
-    _test_success('[r]red [!]bold [_]underline[//] still red[/]',
-                  '\033[0;31mred \033[0;1;31mbold \033[0;1;4;31munderline\033[0;31m still red\033[0m')
-
-
-def test_multi_slash_all_levels():
-    _test_success("[r][!][_]['][////]",
-                  '\033[0;31m\033[0;1;31m\033[0;1;4;31m\033[0;1;3;4;31m\033[0m')
-
-
-def test_space_before_attribute():
-    _test_success('[ r]red text[/]', '\033[0;31mred text\033[0m')
-
-
-def test_space_after_attribute():
-    _test_success('[r ]red text[/]', '\033[0;31mred text\033[0m')
-
-
-def test_space_between_attributes():
-    _test_success('[! r]bold red[/]', '\033[0;1;31mbold red\033[0m')
-
-
-def test_multiple_spaces_between_attributes():
-    _test_success('[!  _  r]styled[/]', '\033[0;1;4;31mstyled\033[0m')
-
-
-def test_space_before_color_code():
-    _test_success('[ #ff0000 ]red[/]', '\033[0;38;2;255;0;0mred\033[0m')
-
-
-def test_invalid_hex_digit_fg_true_color():
-    _test_failure('[#ffgg00]text[/]', 'At offset 4: invalid hex digit `g` in true color specifier')
-
-
-def test_invalid_hex_digit_fg_true_color_uppercase():
-    _test_failure('[#ff00ZZ]text[/]', 'At offset 6: invalid hex digit `Z` in true color specifier')
-
-
-def test_invalid_hex_digit_fg_true_color_symbol():
-    _test_failure('[#ff00@0]text[/]', 'At offset 6: invalid hex digit `@` in true color specifier')
-
-
-def test_incomplete_true_color_fg_four_digits():
-    _test_failure('[#ff00]text[/]', 'At offset 6: invalid hex digit `]` in true color specifier')
-
-
-def test_incomplete_true_color_fg_three_digits():
-    _test_failure('[#abc]text[/]', 'At offset 5: invalid hex digit `]` in true color specifier')
-
-
-def test_incomplete_true_color_fg_one_digit():
-    _test_failure('[#f]text[/]', 'At offset 3: invalid hex digit `]` in true color specifier')
-
-
-def test_incomplete_true_color_fg_no_digits():
-    _test_failure('[#]text[/]', 'At offset 2: invalid hex digit `]` in true color specifier')
-
-
-def test_invalid_hex_digit_bg_true_color():
-    _test_failure('[:#ffgg00]text[/]', 'At offset 5: invalid hex digit `g` in true color specifier')
-
-
-def test_invalid_hex_digit_bg_true_color_number():
-    _test_failure('[:#abc12x]text[/]', 'At offset 8: invalid hex digit `x` in true color specifier')
-
-
-def test_incomplete_true_color_bg_two_digits():
-    _test_failure('[:#ff]text[/]', 'At offset 5: invalid hex digit `]` in true color specifier')
-
-
-def test_incomplete_true_color_bg_no_digits():
-    _test_failure('[:#]text[/]', 'At offset 3: invalid hex digit `]` in true color specifier')
-
-
-def test_space_only_opening_tag():
-    _test_failure('[ ]', 'At offset 0: empty opening tag')
-
-
-def test_multiple_spaces_only_opening_tag():
-    _test_failure('[   ]', 'At offset 0: empty opening tag')
-
-
-def test_empty_opening_tag():
-    _test_failure('[]', 'At offset 0: empty opening tag')
-
-
-def test_expecting_color_letter_fg():
-    _test_failure('[', 'At offset 1: expecting `]` to terminate the opening tag')
-
-
-def test_expecting_color_letter_bg():
-    _test_failure('[:', 'At offset 2: incomplete color specifier')
-
-
-def test_unknown_color_letter():
-    _test_failure('[x]text[/]', 'At offset 2: unknown color specifier letter `x`')
-
-
-def test_unknown_bg_color_letter():
-    _test_failure('[:x]text[/]', 'At offset 3: unknown color specifier letter `x`')
-
-
-def test_incomplete_escape_sequence():
-    _test_failure('text\\', 'At offset 4: incomplete escape sequence at end of string')
-
-
-def test_invalid_escape_sequence():
-    _test_failure('\\a', 'At offset 0: invalid escape sequence `\\a`')
-
-
-def test_unbalanced_closing_tag():
-    _test_failure('[/]', 'At offset 0: unbalanced closing tag: attempting to close 1 level(s), but only 0 level(s) are open')
-
-
-def test_unbalanced_closing_tag_extra():
-    _test_failure('[r]text[/] xyz [/] meow', 'At offset 15: unbalanced closing tag: attempting to close 1 level(s), but only 0 level(s) are open')
-
-
-def test_expecting_bracket_after_slash():
-    _test_failure('[/x', 'At offset 0: unterminated closing tag')
-
-
-def test_unbalanced_opening_tag():
-    _test_failure('[r]text', 'At offset 7: unbalanced opening tag: 1 level(s) remain unclosed')
-
-
-def test_unbalanced_opening_tag_nested():
-    _test_failure('[r]text [!]more', 'At offset 15: unbalanced opening tag: 2 level(s) remain unclosed')
-
-
-def test_unclosed_opening_tag():
-    _test_failure('[r', 'At offset 2: expecting `]` to terminate the opening tag')
-
-
-def test_maximum_nesting_depth_exceeded():
-    _test_failure('[r][g][b][y][m][c]text[/][/][/][/][/][/]', 'At offset 15: maximum nesting depth (4) exceeded')
-
-
-def test_multi_slash_too_many():
-    _test_failure('[r][//]', 'At offset 3: unbalanced closing tag: attempting to close 2 level(s), but only 1 level(s) are open')
-
-
-def test_multi_slash_way_too_many():
-    _test_failure('[r]red[/////]', 'At offset 6: unbalanced closing tag: attempting to close 5 level(s), but only 1 level(s) are open')
-
-
-def test_multi_slash_unbalanced():
-    _test_failure('[///]', 'At offset 0: unbalanced closing tag: attempting to close 3 level(s), but only 0 level(s) are open')
-
-
-def test_escape_backslash():
-    _test_escape('\\', '\\\\')
-
-
-def test_escape_bracket():
-    _test_escape('[', '\\[')
-
-
-def test_escape_both():
-    _test_escape('\\[', '\\\\\\[')
-
-
-def test_escape_plain_text():
-    _test_escape('hello', 'hello')
-
-
-def test_escape_mixed():
-    _test_escape('Use [r] for red', 'Use \\[r] for red')
-
-
-def test_escape_multiple_brackets():
-    _test_escape('[red] [blue]', '\\[red] \\[blue]')
-
-
-def test_escape_multiple_backslashes():
-    _test_escape('\\\\\\', '\\\\\\\\\\\\')
-
-
-def test_escape_tag_syntax():
-    _test_escape('[!r]bold red[/]', '\\[!r]bold red\\[/]')
-
-
-def test_escape_ansi_plain_text():
-    _test_escape_ansi('plain text', 'plain text')
-
-
-def test_escape_ansi_bold():
-    _test_escape_ansi('[!]bold text[/]', 'bold text')
-
-
-def test_escape_ansi_red():
-    _test_escape_ansi('[r]red text[/]', 'red text')
-
-
-def test_escape_ansi_bold_red():
-    _test_escape_ansi('[!r]bold red[/]', 'bold red')
-
-
-def test_escape_ansi_nested():
-    _test_escape_ansi('[r]red [!]and bold[/][/]', 'red and bold')
-
-
-def test_escape_ansi_multiple_tags():
-    _test_escape_ansi('[r]red[/] and [b]blue[/]', 'red and blue')
-
-
-def test_escape_ansi_all_attributes():
-    _test_escape_ansi("[!-_'*r:b]complex[/]", 'complex')
-
-
-def test_escape_ansi_bright_colors():
-    _test_escape_ansi('[*g]bright green[/]', 'bright green')
+# Returns the SGR sequence of `codes`, always the same object for
+# equal `codes`.
+@functools.cache
+def _sgr(codes: tuple[int, ...]) -> bytes:
+    return b'\x1b[' + b';'.join(b'%d' % code for code in codes) + b'm'
+
+
+SUCCESS_CASES = [
+    pytest.param(b'[!]bold text[/]', _sgr((0, 1)) + b'bold text' + _sgr((0,)), id='bold'),
+    pytest.param(b'[_]underlined text[/]', _sgr((0, 4)) + b'underlined text' + _sgr((0,)), id='underline'),
+    pytest.param(b"[']italic text[/]", _sgr((0, 3)) + b'italic text' + _sgr((0,)), id='italic'),
+    pytest.param(b'[-]dim text[/]', _sgr((0, 2)) + b'dim text' + _sgr((0,)), id='dim'),
+    pytest.param(b'[^]reverse video[/]', _sgr((0, 7)) + b'reverse video' + _sgr((0,)), id='reverse'),
+    pytest.param(b'[*r]bright red[/]', _sgr((0, 91)) + b'bright red' + _sgr((0,)), id='bright_red'),
+    pytest.param(b'[*]bright alone[/]', _sgr((0,)) + b'bright alone' + _sgr((0,)), id='bright_alone'),
+    pytest.param(b'[*d]bright default[/]', _sgr((0, 99)) + b'bright default' + _sgr((0,)), id='bright_default_color'),
+    pytest.param(b'[d]default color[/]', _sgr((0, 39)) + b'default color' + _sgr((0,)), id='fg_color_default'),
+    pytest.param(b'[k]black text[/]', _sgr((0, 30)) + b'black text' + _sgr((0,)), id='fg_color_black'),
+    pytest.param(b'[r]red text[/]', _sgr((0, 31)) + b'red text' + _sgr((0,)), id='fg_color_red'),
+    pytest.param(b'[g]green text[/]', _sgr((0, 32)) + b'green text' + _sgr((0,)), id='fg_color_green'),
+    pytest.param(b'[y]yellow text[/]', _sgr((0, 33)) + b'yellow text' + _sgr((0,)), id='fg_color_yellow'),
+    pytest.param(b'[b]blue text[/]', _sgr((0, 34)) + b'blue text' + _sgr((0,)), id='fg_color_blue'),
+    pytest.param(b'[m]magenta text[/]', _sgr((0, 35)) + b'magenta text' + _sgr((0,)), id='fg_color_magenta'),
+    pytest.param(b'[c]cyan text[/]', _sgr((0, 36)) + b'cyan text' + _sgr((0,)), id='fg_color_cyan'),
+    pytest.param(b'[w]white text[/]', _sgr((0, 37)) + b'white text' + _sgr((0,)), id='fg_color_white'),
+    pytest.param(b'[:d]default bg[/]', _sgr((0, 49)) + b'default bg' + _sgr((0,)), id='bg_color_default'),
+    pytest.param(b'[:k]black bg[/]', _sgr((0, 40)) + b'black bg' + _sgr((0,)), id='bg_color_black'),
+    pytest.param(b'[:r]red bg[/]', _sgr((0, 41)) + b'red bg' + _sgr((0,)), id='bg_color_red'),
+    pytest.param(b'[:g]green bg[/]', _sgr((0, 42)) + b'green bg' + _sgr((0,)), id='bg_color_green'),
+    pytest.param(b'[:y]yellow bg[/]', _sgr((0, 43)) + b'yellow bg' + _sgr((0,)), id='bg_color_yellow'),
+    pytest.param(b'[:b]blue bg[/]', _sgr((0, 44)) + b'blue bg' + _sgr((0,)), id='bg_color_blue'),
+    pytest.param(b'[:m]magenta bg[/]', _sgr((0, 45)) + b'magenta bg' + _sgr((0,)), id='bg_color_magenta'),
+    pytest.param(b'[:c]cyan bg[/]', _sgr((0, 46)) + b'cyan bg' + _sgr((0,)), id='bg_color_cyan'),
+    pytest.param(b'[:w]white bg[/]', _sgr((0, 47)) + b'white bg' + _sgr((0,)), id='bg_color_white'),
+    pytest.param(b'[!_]bold and underlined[/]',
+                 _sgr((0, 1, 4)) + b'bold and underlined' + _sgr((0,)),
+                 id='bold_underline'),
+    pytest.param(b'[!-]bold and dim[/]', _sgr((0, 1, 2)) + b'bold and dim' + _sgr((0,)), id='bold_dim'),
+    pytest.param(b"[!']bold and italic[/]", _sgr((0, 1, 3)) + b'bold and italic' + _sgr((0,)), id='bold_italic'),
+    pytest.param(b'[-_]dim and underline[/]', _sgr((0, 2, 4)) + b'dim and underline' + _sgr((0,)), id='dim_underline'),
+    pytest.param(b"[-']dim and italic[/]", _sgr((0, 2, 3)) + b'dim and italic' + _sgr((0,)), id='dim_italic'),
+    pytest.param(b"[_']underline and italic[/]",
+                 _sgr((0, 3, 4)) + b'underline and italic' + _sgr((0,)),
+                 id='underline_italic'),
+    pytest.param(b'[!^]bold and reverse[/]', _sgr((0, 1, 7)) + b'bold and reverse' + _sgr((0,)), id='bold_reverse'),
+    pytest.param(b"[!-_'^]all text attrs[/]",
+                 _sgr((0, 1, 2, 3, 4, 7)) + b'all text attrs' + _sgr((0,)),
+                 id='all_text_attributes'),
+    pytest.param(b'[r!]red bold[/]', _sgr((0, 1, 31)) + b'red bold' + _sgr((0,)), id='attribute_order_bold_red'),
+    pytest.param(b"['_!]mixed order[/]", _sgr((0, 1, 3, 4)) + b'mixed order' + _sgr((0,)), id='attribute_order_mixed'),
+    pytest.param(b"[y!_':b]color first[/]",
+                 _sgr((0, 1, 3, 4, 33, 44)) + b'color first' + _sgr((0,)),
+                 id='attribute_order_color_first'),
+    pytest.param(b'[!r]bold red[/]', _sgr((0, 1, 31)) + b'bold red' + _sgr((0,)), id='bold_red'),
+    pytest.param(b'[_b]underline blue[/]', _sgr((0, 4, 34)) + b'underline blue' + _sgr((0,)), id='underline_blue'),
+    pytest.param(b"['g]italic green[/]", _sgr((0, 3, 32)) + b'italic green' + _sgr((0,)), id='italic_green'),
+    pytest.param(b'[-r]dim red[/]', _sgr((0, 2, 31)) + b'dim red' + _sgr((0,)), id='dim_red'),
+    pytest.param(b'[^r]reverse red[/]', _sgr((0, 7, 31)) + b'reverse red' + _sgr((0,)), id='reverse_red'),
+    pytest.param(b'[y:b]yellow on blue[/]', _sgr((0, 33, 44)) + b'yellow on blue' + _sgr((0,)), id='fg_and_bg_colors'),
+    pytest.param(b"[!'_r:w]complex[/]",
+                 _sgr((0, 1, 3, 4, 31, 47)) + b'complex' + _sgr((0,)),
+                 id='bold_italic_underline_red_on_white'),
+    pytest.param(b'[*!c]bright bold cyan[/]',
+                 _sgr((0, 1, 96)) + b'bright bold cyan' + _sgr((0,)),
+                 id='bright_bold_cyan'),
+    pytest.param(b'[*y]bright yellow[/]', _sgr((0, 93)) + b'bright yellow' + _sgr((0,)), id='bright_yellow'),
+    pytest.param(b'[*g]bright green[/]', _sgr((0, 92)) + b'bright green' + _sgr((0,)), id='bright_green'),
+    pytest.param(b'[*m]bright magenta[/]', _sgr((0, 95)) + b'bright magenta' + _sgr((0,)), id='bright_magenta'),
+    pytest.param(b'[*k]bright black[/]', _sgr((0, 90)) + b'bright black' + _sgr((0,)), id='bright_black'),
+    pytest.param(b'[*b]bright blue[/]', _sgr((0, 94)) + b'bright blue' + _sgr((0,)), id='bright_blue'),
+    pytest.param(b'[*w]bright white[/]', _sgr((0, 97)) + b'bright white' + _sgr((0,)), id='bright_white'),
+    pytest.param(b'[*:r]bright bg[/]', _sgr((0, 41)) + b'bright bg' + _sgr((0,)), id='bright_with_bg_only'),
+    pytest.param(b'[#ff0000]red[/]', _sgr((0, 38, 2, 255, 0, 0)) + b'red' + _sgr((0,)), id='true_color_fg'),
+    pytest.param(b'[#00ff00]green[/]',
+                 _sgr((0, 38, 2, 0, 255, 0)) + b'green' + _sgr((0,)),
+                 id='true_color_fg_lowercase'),
+    pytest.param(b'[#0000FF]blue[/]', _sgr((0, 38, 2, 0, 0, 255)) + b'blue' + _sgr((0,)), id='true_color_fg_uppercase'),
+    pytest.param(b'[:#ffff00]yellow bg[/]',
+                 _sgr((0, 48, 2, 255, 255, 0)) + b'yellow bg' + _sgr((0,)),
+                 id='true_color_bg'),
+    pytest.param(b'[#ffffff:#000000]white on black[/]',
+                 _sgr((0, 38, 2, 255, 255, 255, 48, 2, 0, 0, 0)) + b'white on black' + _sgr((0,)),
+                 id='true_color_fg_and_bg'),
+    pytest.param(b'[!#e74c3c]bold red[/]',
+                 _sgr((0, 1, 38, 2, 231, 76, 60)) + b'bold red' + _sgr((0,)),
+                 id='true_color_with_bold'),
+    pytest.param(b"['_#3498db]styled blue[/]",
+                 _sgr((0, 3, 4, 38, 2, 52, 152, 219)) + b'styled blue' + _sgr((0,)),
+                 id='true_color_with_italic_underline'),
+    pytest.param(b'no tags here', b'no tags here', id='plain_text'),
+    pytest.param(b'', b'', id='empty_string'),
+    pytest.param(b'[r][/]', _sgr((0, 31)) + _sgr((0,)), id='empty_tagged_content'),
+    pytest.param(b'before [r]red[/] after',
+                 b'before ' + _sgr((0, 31)) + b'red' + _sgr((0,)) + b' after',
+                 id='tags_with_surrounding_text'),
+    pytest.param(b'[r]red[/] and [b]blue[/]',
+                 _sgr((0, 31)) + b'red' + _sgr((0,)) + b' and ' + _sgr((0, 34)) + b'blue' + _sgr((0,)),
+                 id='multiple_separate_tags'),
+    pytest.param(b'\\\\', b'\\', id='mint_escaped_backslash'),
+    pytest.param(b'\\[', b'[', id='mint_escaped_bracket'),
+    pytest.param(b'Use \\[r] for red', b'Use [r] for red', id='mint_escaped_bracket_in_text'),
+    pytest.param(b'[r]red [!]and bold[/][/]',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 1, 31)) + b'and bold' + _sgr((0, 31)) + _sgr((0,)),
+                 id='nested_bold_in_red'),
+    pytest.param(b'[!]bold [r]and red[/][/]',
+                 _sgr((0, 1)) + b'bold ' + _sgr((0, 1, 31)) + b'and red' + _sgr((0, 1)) + _sgr((0,)),
+                 id='nested_red_in_bold'),
+    pytest.param(b"[']italic [_]and underline[/][/]",
+                 _sgr((0, 3)) + b'italic ' + _sgr((0, 3, 4)) + b'and underline' + _sgr((0, 3)) + _sgr((0,)),
+                 id='nested_underline_in_italic'),
+    pytest.param(b'[!]bold [-]and dim[/][/]',
+                 _sgr((0, 1)) + b'bold ' + _sgr((0, 1, 2)) + b'and dim' + _sgr((0, 1)) + _sgr((0,)),
+                 id='nested_dim_in_bold'),
+    pytest.param(b'[!]bold [^]and reverse[/][/]',
+                 _sgr((0, 1)) + b'bold ' + _sgr((0, 1, 7)) + b'and reverse' + _sgr((0, 1)) + _sgr((0,)),
+                 id='nested_reverse_in_bold'),
+    pytest.param(b'[-]dim [!]and bold[/][/]',
+                 _sgr((0, 2)) + b'dim ' + _sgr((0, 1, 2)) + b'and bold' + _sgr((0, 2)) + _sgr((0,)),
+                 id='nested_bold_in_dim'),
+    pytest.param(b'[r]red [:b]on blue[/][/]',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 31, 44)) + b'on blue' + _sgr((0, 31)) + _sgr((0,)),
+                 id='nested_bg_in_fg'),
+    pytest.param(b'[:b]blue bg [y]yellow text[/][/]',
+                 _sgr((0, 44)) + b'blue bg ' + _sgr((0, 33, 44)) + b'yellow text' + _sgr((0, 44)) + _sgr((0,)),
+                 id='nested_fg_in_bg'),
+    pytest.param(b'[r]red [!]bold [_]underline[/][/][/]',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 1, 31)) + b'bold ' + _sgr((0, 1, 4, 31)) + b'underline'
+                 + _sgr((0, 1, 31)) + _sgr((0, 31)) + _sgr((0,)),
+                 id='nested_three_levels'),
+    pytest.param(b'[r]red [*]bright[/][/]',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 91)) + b'bright' + _sgr((0, 31)) + _sgr((0,)),
+                 id='nested_bright_in_color'),
+    pytest.param(b'[*r]bright red [g]green[/][/]',
+                 _sgr((0, 91)) + b'bright red ' + _sgr((0, 92)) + b'green' + _sgr((0, 91)) + _sgr((0,)),
+                 id='nested_color_in_bright'),
+    pytest.param(b"[!]b [_]u [']i [r]r[/][/][/][/]",
+                 _sgr((0, 1)) + b'b ' + _sgr((0, 1, 4)) + b'u ' + _sgr((0, 1, 3, 4)) + b'i '
+                 + _sgr((0, 1, 3, 4, 31)) + b'r' + _sgr((0, 1, 3, 4)) + _sgr((0, 1, 4)) + _sgr((0, 1))
+                 + _sgr((0,)),
+                 id='nested_all_attributes'),
+    pytest.param(b'[r]start [!]middle[/] end[/]',
+                 _sgr((0, 31)) + b'start ' + _sgr((0, 1, 31)) + b'middle' + _sgr((0, 31)) + b' end'
+                 + _sgr((0,)),
+                 id='nested_with_text_between'),
+    pytest.param(b'[!]bold [!]still bold[/][/]',
+                 _sgr((0, 1)) + b'bold ' + _sgr((0, 1)) + b'still bold' + _sgr((0, 1)) + _sgr((0,)),
+                 id='nested_same_attribute'),
+    pytest.param(b'[r]red [g]green [b]blue[/][/][/]',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 32)) + b'green ' + _sgr((0, 34)) + b'blue' + _sgr((0, 32))
+                 + _sgr((0, 31)) + _sgr((0,)),
+                 id='nested_multiple_colors'),
+    pytest.param(b'[:r]red bg [:b]blue bg[/][/]',
+                 _sgr((0, 41)) + b'red bg ' + _sgr((0, 44)) + b'blue bg' + _sgr((0, 41)) + _sgr((0,)),
+                 id='nested_multiple_backgrounds'),
+    pytest.param(b"[!][_][']text[/][/][/]",
+                 _sgr((0, 1)) + _sgr((0, 1, 4)) + _sgr((0, 1, 3, 4)) + b'text' + _sgr((0, 1, 4))
+                 + _sgr((0, 1)) + _sgr((0,)),
+                 id='consecutive_nested_tags'),
+    pytest.param(b'[r]red [!]bold[//]',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 1, 31)) + b'bold' + _sgr((0,)),
+                 id='multi_slash_double_close'),
+    pytest.param(b'[r]red [!]bold [_]underline[///]',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 1, 31)) + b'bold ' + _sgr((0, 1, 4, 31)) + b'underline'
+                 + _sgr((0,)),
+                 id='multi_slash_triple_close'),
+    pytest.param(b"[r]red [!]bold [_]underline [']italic[////]",
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 1, 31)) + b'bold ' + _sgr((0, 1, 4, 31)) + b'underline '
+                 + _sgr((0, 1, 3, 4, 31)) + b'italic' + _sgr((0,)),
+                 id='multi_slash_quadruple_close'),
+    pytest.param(b'[r]red [!]bold[//] normal text',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 1, 31)) + b'bold' + _sgr((0,)) + b' normal text',
+                 id='multi_slash_with_text_after'),
+    pytest.param(b'[r]red [!]bold [_]underline[/] back to bold[//]',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 1, 31)) + b'bold ' + _sgr((0, 1, 4, 31)) + b'underline'
+                 + _sgr((0, 1, 31)) + b' back to bold' + _sgr((0,)),
+                 id='multi_slash_mixed_with_single'),
+    pytest.param(b'[r]red [!]bold [_]underline[//] still red[/]',
+                 _sgr((0, 31)) + b'red ' + _sgr((0, 1, 31)) + b'bold ' + _sgr((0, 1, 4, 31)) + b'underline'
+                 + _sgr((0, 31)) + b' still red' + _sgr((0,)),
+                 id='multi_slash_double_in_middle'),
+    pytest.param(b"[r][!][_]['][////]",
+                 _sgr((0, 31)) + _sgr((0, 1, 31)) + _sgr((0, 1, 4, 31)) + _sgr((0, 1, 3, 4, 31)) + _sgr((0,)),
+                 id='multi_slash_all_levels'),
+    pytest.param(b'[ r]red text[/]', _sgr((0, 31)) + b'red text' + _sgr((0,)), id='space_before_attribute'),
+    pytest.param(b'[r ]red text[/]', _sgr((0, 31)) + b'red text' + _sgr((0,)), id='space_after_attribute'),
+    pytest.param(b'[! r]bold red[/]', _sgr((0, 1, 31)) + b'bold red' + _sgr((0,)), id='space_between_attributes'),
+    pytest.param(b'[!  _  r]styled[/]',
+                 _sgr((0, 1, 4, 31)) + b'styled' + _sgr((0,)),
+                 id='multiple_spaces_between_attributes'),
+    pytest.param(b'[ #ff0000 ]red[/]', _sgr((0, 38, 2, 255, 0, 0)) + b'red' + _sgr((0,)), id='space_before_color_code'),
+]
+
+
+FAILURE_CASES = [
+    pytest.param(b'[#ffgg00]text[/]',
+                 b'At offset 4: invalid hex digit `g` in true color specifier',
+                 id='invalid_hex_digit_fg_true_color'),
+    pytest.param(b'[#ff00ZZ]text[/]',
+                 b'At offset 6: invalid hex digit `Z` in true color specifier',
+                 id='invalid_hex_digit_fg_true_color_uppercase'),
+    pytest.param(b'[#ff00@0]text[/]',
+                 b'At offset 6: invalid hex digit `@` in true color specifier',
+                 id='invalid_hex_digit_fg_true_color_symbol'),
+    pytest.param(b'[#ff00]text[/]',
+                 b'At offset 6: invalid hex digit `]` in true color specifier',
+                 id='incomplete_true_color_fg_four_digits'),
+    pytest.param(b'[#abc]text[/]',
+                 b'At offset 5: invalid hex digit `]` in true color specifier',
+                 id='incomplete_true_color_fg_three_digits'),
+    pytest.param(b'[#f]text[/]',
+                 b'At offset 3: invalid hex digit `]` in true color specifier',
+                 id='incomplete_true_color_fg_one_digit'),
+    pytest.param(b'[#]text[/]',
+                 b'At offset 2: invalid hex digit `]` in true color specifier',
+                 id='incomplete_true_color_fg_no_digits'),
+    pytest.param(b'[:#ffgg00]text[/]',
+                 b'At offset 5: invalid hex digit `g` in true color specifier',
+                 id='invalid_hex_digit_bg_true_color'),
+    pytest.param(b'[:#abc12x]text[/]',
+                 b'At offset 8: invalid hex digit `x` in true color specifier',
+                 id='invalid_hex_digit_bg_true_color_number'),
+    pytest.param(b'[:#ff]text[/]',
+                 b'At offset 5: invalid hex digit `]` in true color specifier',
+                 id='incomplete_true_color_bg_two_digits'),
+    pytest.param(b'[:#]text[/]',
+                 b'At offset 3: invalid hex digit `]` in true color specifier',
+                 id='incomplete_true_color_bg_no_digits'),
+    pytest.param(b'[ ]', b'At offset 0: empty opening tag', id='space_only_opening_tag'),
+    pytest.param(b'[   ]', b'At offset 0: empty opening tag', id='multiple_spaces_only_opening_tag'),
+    pytest.param(b'[]', b'At offset 0: empty opening tag', id='empty_opening_tag'),
+    pytest.param(b'[', b'At offset 1: expecting `]` to terminate the opening tag', id='expecting_color_letter_fg'),
+    pytest.param(b'[:', b'At offset 2: incomplete color specifier', id='expecting_color_letter_bg'),
+    pytest.param(b'[x]text[/]', b'At offset 2: unknown color specifier letter `x`', id='unknown_color_letter'),
+    pytest.param(b'[:x]text[/]', b'At offset 3: unknown color specifier letter `x`', id='unknown_bg_color_letter'),
+    pytest.param(b'text\\',
+                 b'At offset 4: incomplete escape sequence at end of string',
+                 id='incomplete_escape_sequence'),
+    pytest.param(b'\\a', b'At offset 0: invalid escape sequence `\\a`', id='invalid_escape_sequence'),
+    pytest.param(b'[/]',
+                 b'At offset 0: unbalanced closing tag: attempting to close 1 level(s), but only 0 level(s) are open',
+                 id='unbalanced_closing_tag'),
+    pytest.param(b'[r]text[/] xyz [/] meow',
+                 b'At offset 15: unbalanced closing tag: attempting to close 1 level(s), but only 0 level(s) are open',
+                 id='unbalanced_closing_tag_extra'),
+    pytest.param(b'[/x', b'At offset 0: unterminated closing tag', id='expecting_bracket_after_slash'),
+    pytest.param(b'[r]text',
+                 b'At offset 7: unbalanced opening tag: 1 level(s) remain unclosed',
+                 id='unbalanced_opening_tag'),
+    pytest.param(b'[r]text [!]more',
+                 b'At offset 15: unbalanced opening tag: 2 level(s) remain unclosed',
+                 id='unbalanced_opening_tag_nested'),
+    pytest.param(b'[r', b'At offset 2: expecting `]` to terminate the opening tag', id='unclosed_opening_tag'),
+    pytest.param(b'[r][g][b][y][m][c]text[/][/][/][/][/][/]',
+                 b'At offset 15: maximum nesting depth (4) exceeded',
+                 id='maximum_nesting_depth_exceeded'),
+    pytest.param(b'[r][//]',
+                 b'At offset 3: unbalanced closing tag: attempting to close 2 level(s), but only 1 level(s) are open',
+                 id='multi_slash_too_many'),
+    pytest.param(b'[r]red[/////]',
+                 b'At offset 6: unbalanced closing tag: attempting to close 5 level(s), but only 1 level(s) are open',
+                 id='multi_slash_way_too_many'),
+    pytest.param(b'[///]',
+                 b'At offset 0: unbalanced closing tag: attempting to close 3 level(s), but only 0 level(s) are open',
+                 id='multi_slash_unbalanced'),
+]
+
+
+ESCAPE_CASES = [
+    pytest.param(b'\\', b'\\\\', id='escape_backslash'),
+    pytest.param(b'[', b'\\[', id='escape_bracket'),
+    pytest.param(b'\\[', b'\\\\\\[', id='escape_both'),
+    pytest.param(b'hello', b'hello', id='escape_plain_text'),
+    pytest.param(b'Use [r] for red', b'Use \\[r] for red', id='escape_mixed'),
+    pytest.param(b'[red] [blue]', b'\\[red] \\[blue]', id='escape_multiple_brackets'),
+    pytest.param(b'\\\\\\', b'\\\\\\\\\\\\', id='escape_multiple_backslashes'),
+    pytest.param(b'[!r]bold red[/]', b'\\[!r]bold red\\[/]', id='escape_tag_syntax'),
+]
+
+
+ESCAPE_ANSI_CASES = [
+    pytest.param(b'plain text', b'plain text', id='escape_ansi_plain_text'),
+    pytest.param(b'[!]bold text[/]', b'bold text', id='escape_ansi_bold'),
+    pytest.param(b'[r]red text[/]', b'red text', id='escape_ansi_red'),
+    pytest.param(b'[!r]bold red[/]', b'bold red', id='escape_ansi_bold_red'),
+    pytest.param(b'[r]red [!]and bold[/][/]', b'red and bold', id='escape_ansi_nested'),
+    pytest.param(b'[r]red[/] and [b]blue[/]', b'red and blue', id='escape_ansi_multiple_tags'),
+    pytest.param(b"[!-_'*r:b]complex[/]", b'complex', id='escape_ansi_all_attributes'),
+    pytest.param(b'[*g]bright green[/]', b'bright green', id='escape_ansi_bright_colors'),
+    pytest.param(b'before [y]yellow[/] after', b'before yellow after', id='escape_ansi_with_surrounding_text'),
+    pytest.param(b'', b'', id='escape_ansi_empty_string'),
+    pytest.param(b'[r]red [!]bold [_]underline[/] back[/] normal[/]',
+                 b'red bold underline back normal',
+                 id='escape_ansi_nested_three_levels'),
+]
+
+
+@pytest.mark.parametrize('input_string,expected_output', SUCCESS_CASES)
+def test_success(mint_tester, input_string: bytes, expected_output: bytes):
+    _test_success(mint_tester, input_string, expected_output)
+
+
+@pytest.mark.parametrize('input_string,expected_error', FAILURE_CASES)
+def test_failure(mint_tester, input_string: bytes, expected_error: bytes):
+    _test_failure(mint_tester, input_string, expected_error)
+
+
+@pytest.mark.parametrize('input_string,expected_output', ESCAPE_CASES)
+def test_escape(mint_tester, input_string: bytes, expected_output: bytes):
+    _test_escape(mint_tester, input_string, expected_output)
+
+
+@pytest.mark.parametrize('input_string,expected_output', ESCAPE_ANSI_CASES)
+def test_escape_ansi(mint_tester, input_string: bytes, expected_output: bytes):
+    _test_escape_ansi(mint_tester, input_string, expected_output)
+
+
+def test_mint_tester_executable():
+    result = _run_tester([mint_tester_path, '[!]bold text[/]'])
+    assert result.returncode == 0
+    assert result.stdout == _sgr((0, 1)) + b'bold text' + _sgr((0,))
 
 
-def test_escape_ansi_with_surrounding_text():
-    _test_escape_ansi('before [y]yellow[/] after', 'before yellow after')
+def test_mint_tester_executable_error():
+    result = _run_tester([mint_tester_path, '[]'])
+    assert result.returncode == 1
+    assert result.stdout == b'ERROR: At offset 0: empty opening tag'
 
 
-def test_escape_ansi_empty_string():
-    _test_escape_ansi('', '')
+def test_escape_tester_executable():
+    result = _run_tester([escape_tester_path, 'Use [r] for red'])
+    assert result.returncode == 0
+    assert result.stdout == b'Use \\[r] for red'
 
 
-def test_escape_ansi_nested_three_levels():
-    _test_escape_ansi('[r]red [!]bold [_]underline[/] back[/] normal[/]', 'red bold underline back normal')
+def test_escape_ansi_tester_executable():
+    result = _run_tester([escape_ansi_tester_path, '[r]red[/] and [b]blue[/]'])
+    assert result.returncode == 0
+    assert result.stdout == b'red and blue'
 
 
 def test_terminal_support_tty_with_dumb_term():
-    _test_terminal_support_with_pty({'TERM': 'dumb'}, 'none')
+    _test_terminal_support_with_pty({'TERM': 'dumb'}, b'none')
 
 
 def test_terminal_support_tty_without_term():
-    _test_terminal_support_with_pty({}, 'none')
+    _test_terminal_support_with_pty({}, b'none')
 
 
 def test_terminal_support_no_tty_with_valid_term():
-    _test_terminal_support_no_tty({'TERM': 'xterm'}, 'none')
+    _test_terminal_support_no_tty({'TERM': 'xterm'}, b'none')
 
 
 def test_terminal_support_no_tty_without_term():
-    _test_terminal_support_no_tty({}, 'none')
+    _test_terminal_support_no_tty({}, b'none')
 
 
 def test_terminal_support_tty_with_valid_term():
-    _test_terminal_support_with_pty({'TERM': 'xterm'}, 'basic-color')
+    _test_terminal_support_with_pty({'TERM': 'xterm'}, b'basic-color')
 
 
 def test_terminal_support_term_256color():
-    _test_terminal_support_with_pty({'TERM': 'xterm-256color'}, 'basic-color')
+    _test_terminal_support_with_pty({'TERM': 'xterm-256color'}, b'basic-color')
 
 
 def test_terminal_support_colorterm_truecolor():
-    _test_terminal_support_with_pty({'TERM': 'xterm', 'COLORTERM': 'truecolor'}, 'true-color')
+    _test_terminal_support_with_pty({'TERM': 'xterm', 'COLORTERM': 'truecolor'}, b'true-color')
 
 
 def test_terminal_support_colorterm_24bit():
-    _test_terminal_support_with_pty({'TERM': 'xterm', 'COLORTERM': '24bit'}, 'true-color')
+    _test_terminal_support_with_pty({'TERM': 'xterm', 'COLORTERM': '24bit'}, b'true-color')
 
 
 def test_terminal_support_colorterm_yes():
-    _test_terminal_support_with_pty({'TERM': 'xterm', 'COLORTERM': 'yes'}, 'true-color')
+    _test_terminal_support_with_pty({'TERM': 'xterm', 'COLORTERM': 'yes'}, b'true-color')
 
 
 def test_terminal_support_term_direct():
-    _test_terminal_support_with_pty({'TERM': 'xterm-direct'}, 'true-color')
+    _test_terminal_support_with_pty({'TERM': 'xterm-direct'}, b'true-color')
 
 
 def test_terminal_support_term_alacritty():
-    _test_terminal_support_with_pty({'TERM': 'alacritty'}, 'true-color')
+    _test_terminal_support_with_pty({'TERM': 'alacritty'}, b'true-color')
 
 
 def test_terminal_support_term_xterm_kitty():
-    _test_terminal_support_with_pty({'TERM': 'xterm-kitty'}, 'true-color')
+    _test_terminal_support_with_pty({'TERM': 'xterm-kitty'}, b'true-color')
 
 
 def test_terminal_support_term_wezterm():
-    _test_terminal_support_with_pty({'TERM': 'wezterm'}, 'true-color')
+    _test_terminal_support_with_pty({'TERM': 'wezterm'}, b'true-color')
 
 
 def test_terminal_support_term_foot():
-    _test_terminal_support_with_pty({'TERM': 'foot'}, 'true-color')
+    _test_terminal_support_with_pty({'TERM': 'foot'}, b'true-color')
 
 
 def test_terminal_support_term_ghostty():
-    _test_terminal_support_with_pty({'TERM': 'ghostty'}, 'true-color')
+    _test_terminal_support_with_pty({'TERM': 'ghostty'}, b'true-color')
 
 
 def test_terminal_support_preserves_errno():
-    result = subprocess.run([os.path.join(testers_path, 'terminal-support-errno-tester')],
-                            capture_output=True, text=True)
+    result = _run_tester([terminal_support_errno_tester_path])
     assert result.returncode == 0
-    assert result.stdout.strip() == '42'
+    assert result.stdout.strip() == b'42'
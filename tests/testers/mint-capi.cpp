@@ -0,0 +1,102 @@
+/*
+ * Copyright (C) 2025 Philippe Proulx <eeppeliteloop@gmail.com>
+ * SPDX-License-Identifier: MIT
+ */
+
+/*
+ * C API over `mint.hpp` so that the tests may call mint::mint(),
+ * mint::escape(), and mint::escapeAnsi() in-process.
+ *
+ * Each function writes its output to the caller-provided buffer `buf`
+ * of `cap` bytes and sets `*len` to the length of the output. If
+ * `*len` is greater than `cap`, then the function didn't write
+ * anything: call it again with a buffer of at least `*len` bytes.
+ *
+ * No exception ever propagates out of those functions: on any
+ * unexpected exception, they return 2.
+ */
+
+#include <cstddef>
+#include <cstring>
+#include <stdexcept>
+#include <string>
+
+#include "mint.hpp"
+
+namespace {
+
+void copyOutput(const std::string& output, char * const buf, const std::size_t cap,
+                std::size_t * const len) noexcept
+{
+    if (output.size() <= cap) {
+        std::memcpy(buf, output.data(), output.size());
+    }
+
+    *len = output.size();
+}
+
+} /* namespace */
+
+extern "C" {
+
+/*
+ * Outputs the result of mint::mint() and returns 0, or outputs the
+ * error message and returns 1.
+ */
+int mint_parse(const char * const input, char * const buf, const std::size_t cap,
+               std::size_t * const len)
+{
+    try {
+        copyOutput(mint::mint(input, mint::When::Always), buf, cap, len);
+    } catch (const std::runtime_error& exc) {
+        copyOutput(exc.what(), buf, cap, len);
+        return 1;
+    } catch (...) {
+        copyOutput("Unexpected exception", buf, cap, len);
+        return 2;
+    }
+
+    return 0;
+}
+
+/*
+ * Outputs the result of mint::escape() and returns 0, or outputs the
+ * error message and returns 1.
+ */
+int mint_escape(const char * const input, char * const buf, const std::size_t cap,
+                std::size_t * const len)
+{
+    try {
+        copyOutput(mint::escape(input), buf, cap, len);
+    } catch (const std::runtime_error& exc) {
+        copyOutput(exc.what(), buf, cap, len);
+        return 1;
+    } catch (...) {
+        copyOutput("Unexpected exception", buf, cap, len);
+        return 2;
+    }
+
+    return 0;
+}
+
+/*
+ * Outputs the result of mint::escapeAnsi(mint::mint()) and returns 0,
+ * or outputs the error message and returns 1.
+ */
+int mint_escape_ansi(const char * const input, char * const buf, const std::size_t cap,
+                     std::size_t * const len)
+{
+    try {
+        copyOutput(mint::escapeAnsi(mint::mint(input, mint::When::Always)), buf, cap, len);
+    } catch (const std::runtime_error& exc) {
+        copyOutput(exc.what(), buf, cap, len);
+        return 1;
+    } catch (...) {
+        copyOutput("Unexpected exception", buf, cap, len);
+        return 2;
+    }
+
+    return 0;
+}
+
+} /* extern "C" */